@@ -2,8 +2,27 @@ import os
 import sys
 import fnmatch
 import argparse
+import codecs
+import functools
+import mmap
+import operator
 import re
-from typing import Set, Optional
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    AnyStr,
+    Callable,
+    FrozenSet,
+    Iterator,
+    List,
+    Set,
+    Optional,
+    Pattern,
+    Tuple,
+)
 
 
 def load_gitignore_patterns(root: str) -> Set[str]:
@@ -20,27 +39,64 @@ def load_gitignore_patterns(root: str) -> Set[str]:
     return patterns
 
 
-def matches_pattern(path: str, patterns: Set[str]) -> bool:
+# fnmatch follows the platform's case rules (case-insensitive on Windows)
+_CASE_INSENSITIVE = os.path.normcase("A") == "a"
+
+# Paths only need separators rewritten to "/" where os.sep is something else
+_NEEDS_NORM = os.sep != "/"
+
+
+# eq=False keeps identity hashing, so instances are cheap lru_cache keys
+@dataclass(frozen=True, eq=False)
+class CompiledPatterns:
+    """Ignore patterns pre-sorted into buckets, each matched in a single step."""
+
+    excluded_exts: FrozenSet[str]
+    literal_segs: FrozenSet[str]
+    dir_names: FrozenSet[str]
+    dir_prefixes: Tuple[str, ...]
+    full_re: Optional[Pattern]
+    base_re: Optional[Pattern]
+
+
+def _join_globs(globs, flags: int = 0) -> Optional[Pattern]:
+    globs = sorted(globs)
+    if not globs:
+        return None
+    return re.compile("|".join(f"(?:{fnmatch.translate(g)})" for g in globs), flags)
+
+
+_EXT_PATTERN = re.compile(r"\*\.[A-Za-z0-9]+\Z")
+_GLOB_CHARS = re.compile(r"[*?[]")
+
+
+def compile_patterns(patterns: Set[str]) -> CompiledPatterns:
     """
-    Return True if `path` (relative to root) matches any of the ignore patterns.
+    Translate ignore patterns into the structures used by `matches_pattern`.
 
     Simplified .gitignore-style behavior:
     - Patterns ending with "/" are treated as directory names and will match
       any directory with that name at any depth (e.g. "node_modules/").
     - Patterns starting with "/" are treated as anchored at the root.
     - Plain globs like "*.png" or "dist" still work as before.
-    """
-    # Normalize to forward slashes and strip a leading "./" if present
-    norm = path.replace(os.sep, "/")
-    if norm.startswith("./"):
-        norm = norm[2:]
-    segments = norm.split("/")
 
+    Every glob is checked both against the full relative path (e.g.
+    "dist/*.js") and against each path segment ("*.png", "dist", ".env"), so
+    all globs end up in one combined regex per check instead of one fnmatch
+    call per pattern and segment. Patterns without wildcards or "/" can only
+    match a whole segment, so they are kept in a set instead.
+    """
+    dir_prefixes = set()
+    excluded_exts = set()
+    literal_segs = set()
+    globs = set()
     for pat in patterns:
         if not pat:
             continue
 
         raw = pat.replace(os.sep, "/")
+        if _CASE_INSENSITIVE:
+            raw = raw.lower()
 
         # Leading "/" -> anchor at root
         anchored = raw.startswith("/")
@@ -49,131 +105,610 @@ def matches_pattern(path: str, patterns: Set[str]) -> bool:
         # Trailing "/" -> directory-only pattern
         dir_only = p.endswith("/")
         p = p.rstrip("/") if dir_only else p
+        if not p:
+            continue
+
+        # Anchored directories must be exactly that dir at root or anything
+        # under it. Unanchored ones match a segment anywhere in the path,
+        # which the per-segment glob check below already covers.
+        if dir_only and anchored:
+            dir_prefixes.add(p)
+
+        # "*.png"-style patterns also go into a set of extensions, so most
+        # media files are rejected before any regex runs
+        if _EXT_PATTERN.match(p):
+            excluded_exts.add(p[1:])
+
+        if "/" in p or _GLOB_CHARS.search(p):
+            globs.add(p)
+        else:
+            literal_segs.add(p)
+
+    return CompiledPatterns(
+        excluded_exts=frozenset(excluded_exts),
+        literal_segs=frozenset(literal_segs),
+        dir_names=frozenset(dir_prefixes),
+        # str.startswith accepts a tuple and tries every prefix in C
+        dir_prefixes=tuple(sorted(d + "/" for d in dir_prefixes)),
+        full_re=_join_globs(globs),
+        # A single segment never contains "/", so only slash-free globs apply
+        base_re=_join_globs(g for g in globs if "/" not in g),
+    )
 
-        # Directory-only patterns: "foo/" or "/foo/"
-        if dir_only:
-            if anchored:
-                # Must be exactly that dir at root or anything under it
-                if norm == p or norm.startswith(p + "/"):
-                    return True
-            else:
-                # Match any directory with that name anywhere in the path
-                if p in segments:
-                    return True
 
-        # Full-path glob (e.g. "dist/*.js")
-        if fnmatch.fnmatch(norm, p):
-            return True
+def matches_pattern(path: str, patterns: CompiledPatterns) -> bool:
+    """
+    Return True if `path` (relative to root) matches any of the ignore patterns.
+    """
+    # Normalize to forward slashes and strip a leading "./" if present
+    norm = path.replace(os.sep, "/") if _NEEDS_NORM else path
+    if norm.startswith("./"):
+        norm = norm[2:]
+    if _CASE_INSENSITIVE:
+        norm = norm.lower()
 
-        # Basename match ("*.png", "dist", ".env", etc.) against each path segment
+    if norm in patterns.dir_names or norm.startswith(patterns.dir_prefixes):
+        return True
+
+    # Literal names (".git", "node_modules", ".env") against each path segment
+    segments = norm.split("/")
+    if not patterns.literal_segs.isdisjoint(segments):
+        return True
+
+    # Full-path glob (e.g. "dist/*.js")
+    if patterns.full_re is not None and patterns.full_re.match(norm):
+        return True
+
+    # Basename glob ("*.png", "*.py[cod]") against each path segment
+    base_re = patterns.base_re
+    if base_re is not None:
         for seg in segments:
-            if fnmatch.fnmatch(seg, p):
+            if base_re.match(seg):
                 return True
 
     return False
 
 
-def print_tree(root: str, patterns: Set[str]) -> str:
-    lines = ["/"]
-    for cur_dir, dirs, files in os.walk(root):
-        rel_dir = os.path.relpath(cur_dir, root)
-        if rel_dir != "." and matches_pattern(rel_dir, patterns):
-            dirs[:] = []
+def has_excluded_ext(name: str, patterns: CompiledPatterns) -> bool:
+    """
+    Fast pre-check for a file name: True if its extension alone matches one of
+    the "*.ext" ignore patterns, in which case `matches_pattern` would too.
+    """
+    if _CASE_INSENSITIVE:
+        name = name.lower()
+    i = name.rfind(".")
+    return i != -1 and name[i:] in patterns.excluded_exts
+
+
+def compile_include(patterns: Set[str]) -> Optional[Pattern]:
+    """
+    Combine the --include globs into one regex, matched against both a file's
+    relative path and its name. Returns None when there is nothing to match.
+    """
+    flags = re.IGNORECASE if _CASE_INSENSITIVE else 0
+    return _join_globs({p.replace(os.sep, "/") for p in patterns}, flags)
+
+
+@functools.lru_cache(maxsize=8192)
+def dir_excluded(rel_dir: str, patterns: CompiledPatterns) -> bool:
+    """
+    Cached `matches_pattern` for directories.
+
+    `print_tree` and `dump_contents` walk the same directories, so the second
+    walk reuses the first one's answers.
+    """
+    return matches_pattern(rel_dir, patterns)
+
+
+def _scan_dir(
+    path: str, rel_prefix: str, patterns: CompiledPatterns
+) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """
+    List the subdirectories and files of `path` that are not ignored.
+
+    The file type comes from the directory listing itself (DirEntry), so no
+    entry is stat-ed. Symlinks are skipped outright rather than resolved, and
+    ignored directories are dropped here, before a walk could descend into
+    them. Unreadable directories are skipped silently, as os.walk does.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    dirs = []
+    files = []
+    for entry in entries:
+        if entry.is_symlink():
             continue
-        entries = sorted(dirs + files, key=lambda x: (x in files, x.lower()))
-        depth = 0 if rel_dir == "." else rel_dir.count(os.sep) + 1
-        prefix = "    " * depth
-        for name in entries:
-            rel = os.path.join(rel_dir, name) if rel_dir != "." else name
-            if matches_pattern(rel, patterns):
-                continue
-            suffix = "/" if os.path.isdir(os.path.join(cur_dir, name)) else ""
-            lines.append(f"{prefix}{name}{suffix}")
+        rel = rel_prefix + entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if not dir_excluded(rel, patterns):
+                dirs.append(entry)
+        elif not has_excluded_ext(entry.name, patterns) and not matches_pattern(
+            rel, patterns
+        ):
+            files.append(entry)
+    return dirs, files
+
+
+_by_name = operator.attrgetter("name")
+
+# Tree indentation for each depth, built once instead of once per directory
+_INDENTS = ["    " * depth for depth in range(64)]
+
+
+def _iter_tree(
+    path: str, rel_prefix: str, depth: int, patterns: CompiledPatterns
+) -> Iterator[str]:
+    dirs, files = _scan_dir(path, rel_prefix, patterns)
+    prefix = _INDENTS[depth] if depth < len(_INDENTS) else "    " * depth
+    for entry in sorted(dirs, key=lambda e: e.name.lower()):
+        yield f"{prefix}{entry.name}/"
+        yield from _iter_tree(
+            entry.path, rel_prefix + entry.name + os.sep, depth + 1, patterns
+        )
+    for entry in sorted(files, key=lambda e: e.name.lower()):
+        yield f"{prefix}{entry.name}"
+
+
+def print_tree(root: str, patterns: CompiledPatterns) -> str:
+    lines = ["/"]
+    lines.extend(_iter_tree(root, "", 0, patterns))
     return "\n".join(lines)
 
 
-def count_matches(
-    content: str, needle: str, ignore_case: bool, whole_word: bool
-) -> int:
-    if not needle:
-        return 0
+def _iter_files(
+    path: str, rel_prefix: str, patterns: CompiledPatterns, sort: bool = True
+) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (rel_path, entry) for every non-ignored file under `path`: the
+    directory's own files, then each subdirectory in turn. Entries are sorted
+    by name unless `sort` is False, in which case the directory listing order
+    is kept.
+
+    `rel_prefix` is the relative directory with a trailing separator ("" at
+    the root), so relative paths are built by plain concatenation.
+    """
+    dirs, files = _scan_dir(path, rel_prefix, patterns)
+    if sort:
+        files.sort(key=_by_name)
+        dirs.sort(key=_by_name)
+    for entry in files:
+        yield rel_prefix + entry.name, entry
+    for entry in dirs:
+        yield from _iter_files(
+            entry.path, rel_prefix + entry.name + os.sep, patterns, sort
+        )
+
+
+def compile_search(needle: AnyStr, ignore_case: bool, whole_word: bool) -> Pattern:
+    """
+    Compile the search term (str or bytes) into a regex once, so scanning many
+    files does not rebuild the same pattern for every file.
+    """
     flags = re.IGNORECASE if ignore_case else 0
+    pattern = re.escape(needle)
     if whole_word:
-        pattern = r"\b" + re.escape(needle) + r"\b"
-    else:
-        pattern = re.escape(needle)
-    return len(re.findall(pattern, content, flags))
+        boundary = rb"\b" if isinstance(needle, bytes) else r"\b"
+        pattern = boundary + pattern + boundary
+    return re.compile(pattern, flags)
 
 
-def dump_contents(
-    root: str,
-    patterns: Set[str],
-    out_file,
-    search: Optional[str] = None,
-    ignore_case: bool = False,
-    whole_word: bool = False,
-    include_patterns: Optional[Set[str]] = None,
-    exclude_files: Optional[Set[str]] = None,
-):
-    total_matches = 0
-    files_with_matches = 0
+def count_matches(content: AnyStr, compiled_re: Pattern) -> int:
+    # Count lazily rather than building the list of matched strings
+    return sum(1 for _ in compiled_re.finditer(content))
+
+
+def make_counter(
+    needle: AnyStr, ignore_case: bool, whole_word: bool
+) -> Callable[[AnyStr], int]:
+    """
+    Return a function counting occurrences of `needle` in a file's content.
+
+    Case-sensitive substring searches skip the regex engine and use str.count,
+    which counts non-overlapping occurrences exactly like the regex would.
+    Case-insensitive substring searches on bytes compare lowercased copies,
+    which matches re.IGNORECASE for ASCII. Text goes through the compiled
+    pattern, because IGNORECASE also folds characters such as "ſ" and "İ"
+    that str.lower() does not map onto the needle.
+    """
+    if not whole_word:
+        if not ignore_case:
+            return lambda content: content.count(needle)
+        if isinstance(needle, bytes):
+            needle_low = needle.lower()
+            return lambda content: content.lower().count(needle_low)
+    compiled_re = compile_search(needle, ignore_case, whole_word)
+    return lambda content: count_matches(content, compiled_re)
+
+
+def make_file_counter(
+    needle: str, ignore_case: bool, whole_word: bool
+) -> Callable[[bytes], int]:
+    """
+    Return a function counting occurrences of `needle` in a file's raw bytes.
+
+    Pure-ASCII files, the common case for source code, are searched as bytes
+    without decoding; for ASCII text the bytes flavour of \b and case folding
+    gives the same result as the Unicode one. Other files are decoded first,
+    which also raises for files that are not valid UTF-8.
+    """
+    count_text = make_counter(needle, ignore_case, whole_word)
+    count_ascii = None
+    if needle.isascii():
+        count_ascii = make_counter(needle.encode("ascii"), ignore_case, whole_word)
+
+    def count(data: bytes) -> int:
+        if count_ascii is not None and data.isascii():
+            return count_ascii(data)
+        return count_text(data.decode("utf-8"))
+
+    return count
+
+
+# Line between each file's header and its contents
+_SEP = b"-" * 50 + b"\n"
 
-    for cur_dir, dirs, files in os.walk(root):
-        rel_dir = os.path.relpath(cur_dir, root)
-        if rel_dir != "." and matches_pattern(rel_dir, patterns):
-            dirs[:] = []
+# Files are copied to the output in chunks of this many bytes
+_CHUNK_SIZE = 1 << 20
+
+# Files at least this large are probed through mmap before being read in full;
+# below it, setting up the mapping costs more than reading the file
+_MMAP_THRESHOLD = 64 * 1024
+
+# Reads release the GIL, so a few threads per core keep the disk busy
+_READ_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _select_files(
+    entries: Iterator[Tuple[str, os.DirEntry]],
+    include_re: Optional[Pattern],
+    exclude_files: Optional[Set[str]],
+) -> Iterator[Tuple[str, str]]:
+    """Yield (rel_path, file_path) for every file whose contents should be dumped."""
+    for rel_path, entry in entries:
+        fname = entry.name
+        rel_norm = rel_path.replace(os.sep, "/") if _NEEDS_NORM else rel_path
+
+        # Skip explicitly excluded files (relative paths)
+        if exclude_files and rel_norm in exclude_files:
             continue
-        for fname in sorted(files):
-            rel_path = os.path.join(rel_dir, fname)
-            if matches_pattern(rel_path, patterns):
-                continue
 
-            rel_norm = rel_path.replace(os.sep, "/")
+        # If include patterns are provided, only process files matching them
+        if include_re is not None and not (
+            include_re.match(rel_norm) or include_re.match(fname)
+        ):
+            continue
 
-            # Skip explicitly excluded files (relative paths)
-            if exclude_files and rel_norm in exclude_files:
-                continue
+        yield rel_path, entry.path
+
+
+def _count_file(
+    file_path: str, counter: Callable[[bytes], int], probe: Optional[bytes]
+) -> int:
+    """
+    Count search matches in a file. Runs in a worker thread.
+
+    `probe` is a byte string every match must contain. Large files are first
+    searched for it through mmap and skipped, without being read into memory,
+    when it does not occur. Most files do not match, so this is the common
+    path in search mode.
+    """
+    with open(file_path, "rb") as f:
+        if probe is not None and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm.find(probe) == -1:
+                        return 0
+            except (OSError, ValueError):
+                # Not mappable (special file, size changed): just read it
+                pass
+        return counter(f.read())
+
+
+def _copy_utf8(src, dst) -> None:
+    """
+    Copy the binary stream `src` to `dst` in chunks, raising UnicodeError if
+    the data is not valid UTF-8. Only chunks containing non-ASCII bytes (or
+    following an incomplete multi-byte sequence) go through the decoder.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    offset = 0
+    while True:
+        chunk = src.read(_CHUNK_SIZE)
+        final = not chunk
+        pending = decoder.getstate()[0]
+        if final or not chunk.isascii() or pending:
+            try:
+                decoder.decode(chunk, final)
+            except UnicodeDecodeError as e:
+                # The decoder only saw the held-over bytes plus this chunk
+                raise _file_decode_error(e, offset - len(pending)) from None
+        if final:
+            break
+        dst.write(chunk)
+        offset += len(chunk)
 
-            # If include patterns are provided, only process files matching them
-            if include_patterns:
-                included = False
-                for pat in include_patterns:
-                    p = pat.replace(os.sep, "/")
-                    if fnmatch.fnmatch(rel_norm, p) or fnmatch.fnmatch(fname, p):
-                        included = True
-                        break
-                if not included:
-                    continue
 
-            file_path = os.path.join(cur_dir, fname)
+def _file_decode_error(e: UnicodeDecodeError, base: int) -> UnicodeError:
+    """
+    Re-word a chunk's decode error with positions relative to the whole file,
+    in the same format the codec uses.
+    """
+    if e.end - e.start == 1:
+        where = f"byte 0x{e.object[e.start]:02x} in position {base + e.start}"
+    else:
+        where = f"bytes in position {base + e.start}-{base + e.end - 1}"
+    return UnicodeError(f"'{e.encoding}' codec can't decode {where}: {e.reason}")
+
+
+def _header(rel_path: str) -> bytes:
+    return f"File: {rel_path}\n".encode() + _SEP
+
+
+def _write_error(out_file, rel_path: str, e: Exception) -> None:
+    out_file.write(_header(rel_path) + f"[Error reading {rel_path}: {e}]\n\n".encode())
+
+
+def _emit_file(out_file, rel_path: str, file_path: str) -> bool:
+    """
+    Stream a file's bytes into the binary `out_file` under its header, without
+    holding the whole file in memory or transcoding it. If reading fails part
+    way (e.g. invalid UTF-8), the partial output is dropped and an error block
+    is written instead.
+    """
+    start = out_file.tell()
+    try:
+        with open(file_path, "rb") as f:
+            out_file.write(_header(rel_path))
+            _copy_utf8(f, out_file)
+    except Exception as e:
+        out_file.seek(start)
+        out_file.truncate()
+        _write_error(out_file, rel_path, e)
+        return False
+    out_file.write(b"\n")
+    return True
+
+
+def _prefetch_file(file_path: str) -> Optional[bytes]:
+    """
+    Read a file of at most one chunk and check that it is valid UTF-8. Runs in
+    a worker thread. Returns None for larger files, which `_emit_file` streams
+    instead so they are never held in memory whole.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _CHUNK_SIZE:
+            return None
+        data = f.read()
+    if not data.isascii():
+        data.decode("utf-8")
+    return data
+
+
+def _read_ahead(
+    pool: ThreadPoolExecutor,
+    files: Iterator[Tuple[str, str]],
+    fn: Callable,
+    *args,
+) -> Iterator[Tuple[str, str, Future]]:
+    """
+    Submit `fn(file_path, *args)` to `pool` for each file and yield
+    (rel_path, file_path, future) in walk order, keeping a bounded number of
+    files in flight.
+    """
+    pending = deque()
+    for rel_path, file_path in files:
+        future = pool.submit(fn, file_path, *args)
+        pending.append((rel_path, file_path, future))
+        if len(pending) >= _READ_WORKERS * 2:
+            yield pending.popleft()
+    while pending:
+        yield pending.popleft()
+
+
+def _dump_files(
+    files: Iterator[Tuple[str, str]],
+    out_file,
+    search: Optional[str],
+    ignore_case: bool,
+    whole_word: bool,
+) -> Tuple[int, int, int]:
+    """
+    Write `files` into `out_file` in order, keeping only files that match
+    `search` when one is given.
+
+    Returns (total_matches, files_with_matches, files_added).
+    """
+    total_matches = 0
+    files_with_matches = 0
+    files_added = 0
+
+    if not search:
+        # Small files are read in parallel ahead of the writer; anything
+        # larger than a chunk is streamed by the writer itself
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+            for rel_path, file_path, future in _read_ahead(
+                pool, files, _prefetch_file
+            ):
+                try:
+                    data = future.result()
+                except Exception as e:
+                    _write_error(out_file, rel_path, e)
+                    continue
 
+                if data is None:
+                    if not _emit_file(out_file, rel_path, file_path):
+                        continue
+                else:
+                    out_file.write(_header(rel_path))
+                    out_file.write(data)
+                    out_file.write(b"\n")
+                files_added += 1
+        return total_matches, files_with_matches, files_added
+
+    # Files are searched in parallel and matching ones are then streamed out
+    # in walk order, so search mode reads each matching file twice but never
+    # keeps more than one file's content per worker in memory.
+    counter = make_file_counter(search, ignore_case, whole_word)
+    # Any case-sensitive match, whole word or not, contains the term's UTF-8
+    # bytes; case-insensitive matches may not, so those files are always read
+    probe = None if ignore_case else search.encode("utf-8")
+    with ThreadPoolExecutor(max_workers=_READ_WORKERS) as pool:
+        for rel_path, file_path, future in _read_ahead(
+            pool, files, _count_file, counter, probe
+        ):
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+                matches_in_file = future.result()
             except Exception as e:
-                out_file.write(f"File: {rel_path}\n")
-                out_file.write("-" * 50 + "\n")
-                out_file.write(f"[Error reading {rel_path}: {e}]\n")
-                out_file.write("\n")
+                _write_error(out_file, rel_path, e)
                 continue
 
-            matches_in_file = 0
-            if search:
-                matches_in_file = count_matches(
-                    content, search, ignore_case, whole_word
-                )
-                if matches_in_file == 0:
-                    # Skip files that do not match the search criteria
-                    continue
+            if matches_in_file == 0:
+                # Skip files that do not match the search criteria
+                continue
+
+            if _emit_file(out_file, rel_path, file_path):
                 total_matches += matches_in_file
                 files_with_matches += 1
+                files_added += 1
+
+    return total_matches, files_with_matches, files_added
+
+
+def _dump_shard(
+    path: str,
+    shard_path: str,
+    rel_prefix: str,
+    patterns: CompiledPatterns,
+    search: Optional[str],
+    ignore_case: bool,
+    whole_word: bool,
+    include_re: Optional[Pattern],
+    exclude_files: Optional[Set[str]],
+    sort: bool,
+) -> Tuple[int, int, int]:
+    """
+    Dump one top-level subdirectory into `shard_path`. Runs in a worker
+    process when --jobs is used.
+
+    Returns the counts of `_dump_files`.
+    """
+    entries = _iter_files(path, rel_prefix, patterns, sort)
+    files = _select_files(entries, include_re, exclude_files)
+    with open(shard_path, "wb", buffering=1 << 20) as out:
+        return _dump_files(files, out, search, ignore_case, whole_word)
 
-            out_file.write(f"File: {rel_path}\n")
-            out_file.write("-" * 50 + "\n")
-            out_file.write(content)
-            out_file.write("\n")
-            print(f"Added: {rel_path}")
 
+def _dump_sharded(
+    root: str,
+    patterns: CompiledPatterns,
+    out_file,
+    search: Optional[str],
+    ignore_case: bool,
+    whole_word: bool,
+    include_re: Optional[Pattern],
+    exclude_files: Optional[Set[str]],
+    sort: bool,
+    jobs: int,
+) -> Tuple[int, int, int]:
+    """
+    Like `_dump_files` for the whole tree, but each top-level subdirectory is
+    dumped by a separate process. This process writes the root's own files
+    meanwhile, then appends the shards in walk order, so the output is
+    identical to a single-process run.
+    """
+    dirs, root_files = _scan_dir(root, "", patterns)
+    if sort:
+        dirs.sort(key=_by_name)
+        root_files.sort(key=_by_name)
+
+    # Shards live in a directory of their own, so whatever a failed or
+    # interrupted run leaves behind is removed with it
+    with tempfile.TemporaryDirectory() as shard_dir:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        try:
+            futures = [
+                pool.submit(
+                    _dump_shard,
+                    entry.path,
+                    os.path.join(shard_dir, f"{index}.txt"),
+                    entry.name + os.sep,
+                    patterns,
+                    search,
+                    ignore_case,
+                    whole_word,
+                    include_re,
+                    exclude_files,
+                    sort,
+                )
+                for index, entry in enumerate(dirs)
+            ]
+
+            files = _select_files(
+                ((entry.name, entry) for entry in root_files), include_re, exclude_files
+            )
+            total_matches, files_with_matches, files_added = _dump_files(
+                files, out_file, search, ignore_case, whole_word
+            )
+
+            for index, future in enumerate(futures):
+                shard_matches, shard_files, shard_added = future.result()
+                shard_path = os.path.join(shard_dir, f"{index}.txt")
+                with open(shard_path, "rb") as shard:
+                    shutil.copyfileobj(shard, out_file, _CHUNK_SIZE)
+                os.remove(shard_path)
+                total_matches += shard_matches
+                files_with_matches += shard_files
+                files_added += shard_added
+        except KeyboardInterrupt:
+            # The workers got the interrupt too; don't wait on the rest of
+            # the queue before exiting
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
+        pool.shutdown()
+
+    return total_matches, files_with_matches, files_added
+
+
+def dump_contents(
+    root: str,
+    patterns: CompiledPatterns,
+    out_file,
+    search: Optional[str] = None,
+    ignore_case: bool = False,
+    whole_word: bool = False,
+    include_re: Optional[Pattern] = None,
+    exclude_files: Optional[Set[str]] = None,
+    sort: bool = True,
+    jobs: int = 1,
+):
+    if jobs > 1:
+        total_matches, files_with_matches, files_added = _dump_sharded(
+            root,
+            patterns,
+            out_file,
+            search,
+            ignore_case,
+            whole_word,
+            include_re,
+            exclude_files,
+            sort,
+            jobs,
+        )
+    else:
+        entries = _iter_files(root, "", patterns, sort)
+        files = _select_files(entries, include_re, exclude_files)
+        total_matches, files_with_matches, files_added = _dump_files(
+            files, out_file, search, ignore_case, whole_word
+        )
+
+    print(f"Added {files_added} files.")
     return total_matches, files_with_matches
 
 
@@ -225,12 +760,33 @@ def main():
         action="store_true",
         help="Match whole words instead of substrings when searching.",
     )
+    parser.add_argument(
+        "--no-sort",
+        action="store_true",
+        help=(
+            "Dump file contents in directory listing order instead of sorting "
+            "them by name. The directory tree is always sorted."
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Number of processes used to dump file contents. Each top-level "
+            "subdirectory is handled by one process (default: 1)."
+        ),
+    )
     args = parser.parse_args()
 
     root = args.root
     if not os.path.isdir(root):
         print(f"Error: '{root}' is not a directory.")
         sys.exit(1)
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1.")
+        sys.exit(1)
 
     # Build exclusion patterns with defaults
     patterns: Set[str] = {
@@ -262,11 +818,14 @@ def main():
     if args.exclude:
         extra = [p.strip() for p in args.exclude.split(",") if p.strip()]
         patterns.update(extra)
+    compiled = compile_patterns(patterns)
 
     # Include-only patterns (for file contents)
-    include_patterns: Optional[Set[str]] = None
+    include_re: Optional[Pattern] = None
     if args.include:
-        include_patterns = {p.strip() for p in args.include.split(",") if p.strip()}
+        include_re = compile_include(
+            {p.strip() for p in args.include.split(",") if p.strip()}
+        )
 
     # Explicit file exclusions (relative to root)
     exclude_files_set: Optional[Set[str]] = None
@@ -298,21 +857,24 @@ def main():
     folder = os.path.basename(os.path.abspath(root))
     output_file = os.path.join(out_dir, f"{folder}.txt")
 
-    with open(output_file, "w", encoding="utf-8") as out:
-        out.write("Directory Structure:\n")
-        out.write("====================\n")
-        out.write(print_tree(root, patterns))
-        out.write("\n\nFile Contents:\n")
-        out.write("==============\n")
+    # A large buffer turns the many small per-file writes into few syscalls
+    with open(output_file, "wb", buffering=1 << 20) as out:
+        out.write(b"Directory Structure:\n")
+        out.write(b"====================\n")
+        out.write(print_tree(root, compiled).encode())
+        out.write(b"\n\nFile Contents:\n")
+        out.write(b"==============\n")
         total_matches, files_with_matches = dump_contents(
             root,
-            patterns,
+            compiled,
             out,
             search=args.search,
             ignore_case=args.ignore_case,
             whole_word=args.whole_word,
-            include_patterns=include_patterns,
+            include_re=include_re,
             exclude_files=exclude_files_set,
+            sort=not args.no_sort,
+            jobs=args.jobs,
         )
 
     print(f"Done! Output written to {output_file}")